@@ -0,0 +1,34 @@
+"""Shared aiohttp session for the collector's HTTP API clients.
+
+Every TWCClient uses one ClientSession (and so one connection pool)
+instead of each holding its own, which keeps connections to the Wall
+Connectors alive across poll cycles. Headers and timeouts are passed
+per request.
+"""
+
+import aiohttp
+from typing import Optional
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the shared HTTP session."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_shared_session():
+    """Close the shared HTTP session (call once on collector shutdown)."""
+    global _session
+    if _session and not _session.closed:
+        await _session.close()
+    _session = None
@@ -7,8 +7,14 @@ import sys
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Optional
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; use the default event loop
+    uvloop = None
+
 from .config import settings, ChargerConfig
 from .twc_client import TWCClient
+from .http_session import close_shared_session
 from .comed_client import ComEdClient
 from .tessie_client import TessieClient
 from .opower_client import OpowerClient, OpowerAuthError
@@ -1097,6 +1103,9 @@ class Collector:
         if self.tessie_client:
             await self.tessie_client.close()
 
+        # TWC clients share one HTTP session
+        await close_shared_session()
+
         if self.opower_client:
             await self.opower_client.close()
 
@@ -1787,10 +1796,9 @@ class Collector:
             return
 
         try:
-            # Poll each known vehicle
-            for vin in list(self.tessie_vehicles.keys()):
-                vehicle = await self.tessie_client.get_vehicle_state(vin)
-
+            # Poll all known vehicles concurrently
+            states = await self.tessie_client.get_all_states(list(self.tessie_vehicles.keys()))
+            for vin, vehicle in states.items():
                 if vehicle:
                     # Update our cached state
                     old_vehicle = self.tessie_vehicles.get(vin)
@@ -2361,4 +2369,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (libuv) is a faster drop-in event loop on Linux/macOS
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
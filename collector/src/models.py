@@ -1,6 +1,7 @@
 """Data models for Tesla Wall Connector API responses."""
 
-from pydantic import BaseModel, Field
+from array import array
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime, timezone
 
@@ -272,14 +273,20 @@ class FleetEnergySiteLiveStatus(BaseModel):
     wall_connectors: List[FleetWallConnector] = Field(default_factory=list)
     timestamp: Optional[datetime] = None
 
+    @staticmethod
+    def parse_wall_connectors_only(data: dict) -> List[FleetWallConnector]:
+        """Parse just the wall_connectors list from a Fleet API response."""
+        response = data.get("response", data)
+        return [
+            FleetWallConnector.from_api_response(wc_data)
+            for wc_data in response.get("wall_connectors", [])
+        ]
+
     @classmethod
     def from_api_response(cls, data: dict) -> "FleetEnergySiteLiveStatus":
         """Create from Fleet API response."""
         response = data.get("response", data)
-
-        wall_connectors = []
-        for wc_data in response.get("wall_connectors", []):
-            wall_connectors.append(FleetWallConnector.from_api_response(wc_data))
+        wall_connectors = cls.parse_wall_connectors_only(response)
 
         # Parse timestamp if present
         timestamp = None
@@ -674,16 +681,21 @@ class FleetChargeSession(BaseModel):
     }
     """
 
+    # Validation aliases map the nested API payload straight onto fields, so a
+    # whole charge_history list validates in one pass (see from_api_response).
+    # Fields can still be set by name.
+    model_config = ConfigDict(populate_by_name=True)
+
     # Session timing
-    start_timestamp: int  # Unix timestamp (from charge_start_time.seconds)
-    duration_s: int  # Duration in seconds
+    start_timestamp: int = Field(0, validation_alias=AliasPath("charge_start_time", "seconds"))  # Unix timestamp
+    duration_s: int = Field(0, validation_alias=AliasPath("charge_duration", "seconds"))  # Duration in seconds
 
     # Energy
-    energy_wh: float  # Energy added in watt-hours
+    energy_wh: float = Field(0.0, validation_alias="energy_added_wh")  # Energy added in watt-hours
 
     # Device identification
-    din: str  # Wall Connector DIN (e.g., "1457768-02-G--ABC12345678")
-    target_id: str  # Vehicle UUID from Fleet API
+    din: str = ""  # Wall Connector DIN (e.g., "1457768-02-G--ABC12345678")
+    target_id: str = ""  # Vehicle UUID from Fleet API (sent as {"text": ...})
 
     # Optional: Vehicle name (populated after lookup)
     vehicle_name: Optional[str] = None
@@ -694,6 +706,18 @@ class FleetChargeSession(BaseModel):
     delivery_cost_cents: Optional[float] = None  # Delivery cost (fixed rate * kWh)
     full_cost_cents: Optional[float] = None  # Total cost (supply + delivery)
 
+    @field_validator("target_id", mode="before")
+    @classmethod
+    def _unwrap_target_id(cls, value):
+        """Unwrap the API's {"text": ...} target_id; a plain string passes through.
+
+        Not an AliasPath: the API key matches the field name, so a missed
+        path (e.g. {}) would fall back to validating the dict itself as str.
+        """
+        if isinstance(value, dict):
+            return value.get("text", "")
+        return value
+
     @property
     def start_time(self) -> datetime:
         """Start time as datetime (UTC)."""
@@ -765,13 +789,36 @@ class FleetChargeSession(BaseModel):
     @classmethod
     def from_api_response(cls, data: dict) -> "FleetChargeSession":
         """Create from Fleet API telemetry_history response item."""
-        return cls(
-            start_timestamp=data.get("charge_start_time", {}).get("seconds", 0),
-            duration_s=data.get("charge_duration", {}).get("seconds", 0),
-            energy_wh=data.get("energy_added_wh", 0),
-            din=data.get("din", ""),
-            target_id=data.get("target_id", {}).get("text", ""),
-        )
+        return cls.model_validate(data)
+
+
+class FleetChargeSessionArray:
+    """Columnar (struct-of-arrays) form of Fleet API charge sessions.
+
+    Holds the numeric session fields in compact typed arrays instead of one
+    FleetChargeSession model per session, for large backfill windows where
+    only timing and energy are needed (e.g. batch writes and totals).
+    """
+
+    def __init__(self, start_timestamps: array, duration_s: array, energy_wh: array):
+        self.start_timestamps = start_timestamps  # array('q'): Unix seconds
+        self.duration_s = duration_s  # array('q'): Duration in seconds
+        self.energy_wh = energy_wh  # array('d'): Energy added in watt-hours
+
+    def __len__(self) -> int:
+        return len(self.start_timestamps)
+
+    @property
+    def total_energy_wh(self) -> float:
+        """Total energy across all sessions in watt-hours."""
+        return sum(self.energy_wh)
+
+    def to_records(self) -> List[FleetChargeSession]:
+        """Convert back to a list of FleetChargeSession (numeric fields only)."""
+        return [
+            FleetChargeSession(start_timestamp=ts, duration_s=dur, energy_wh=wh)
+            for ts, dur, wh in zip(self.start_timestamps, self.duration_s, self.energy_wh)
+        ]
 
 
 # =============================================================================
@@ -795,6 +842,40 @@ class OpowerUsageRead(BaseModel):
         return self.kwh * 1000.0
 
 
+class OpowerUsageArray:
+    """Columnar (struct-of-arrays) form of a range of Opower usage reads.
+
+    Holds timestamps and kWh in compact typed arrays instead of one
+    OpowerUsageRead model per read, so large ranges (a year of half-hour
+    reads is 17k+ points) stay small in memory and totals are a single
+    pass over a float array.
+    """
+
+    def __init__(self, timestamps: array, kwh: array, resolution: str = "DAY"):
+        self.timestamps = timestamps  # array('q'): Unix seconds, start of period
+        self.kwh = kwh  # array('d'): Energy used in kWh
+        self.resolution = resolution
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def total_kwh(self) -> float:
+        """Total energy across all reads in kWh."""
+        return sum(self.kwh)
+
+    def to_records(self) -> List[OpowerUsageRead]:
+        """Convert back to a list of OpowerUsageRead (timestamps in UTC)."""
+        return [
+            OpowerUsageRead(
+                timestamp=datetime.fromtimestamp(ts, tz=timezone.utc),
+                kwh=kwh,
+                resolution=self.resolution,
+            )
+            for ts, kwh in zip(self.timestamps, self.kwh)
+        ]
+
+
 class OpowerCostRead(BaseModel):
     """Cost reading from ComEd Opower API.
 
@@ -9,19 +9,21 @@ session cookies are cached and can be used to refresh the token without MFA.
 
 import asyncio
 import base64
+import calendar
 import hashlib
 import json
 import logging
 import re
 import secrets
+from array import array
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import httpx
 
-from .models import OpowerUsageRead, OpowerCostRead, OpowerBillSummary, OpowerMetadata
+from .models import OpowerUsageRead, OpowerUsageArray, OpowerCostRead, OpowerBillSummary, OpowerMetadata
 
 logger = logging.getLogger("twc-collector.opower")
 
@@ -33,6 +35,9 @@ B2C_POLICY = "B2C_1A_SignIn"
 COMED_SECURE_BASE = "https://secure.comed.com"
 OPOWER_BASE = "https://cec.opower.com"
 
+# Fixed offset used for Opower time intervals (see _format_time_interval)
+CHICAGO_OFFSET = timezone(timedelta(hours=-6))
+
 # Default headers
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -65,6 +70,34 @@ class OpowerClient:
         'ASP.NET_SessionId', 'ARRAffinity', 'ARRAffinitySameSite'
     }
 
+    # GraphQL query for netUsage reads (shared by the usage list/iter/array paths)
+    USAGE_QUERY = """
+    query GetUsageReads($timeInterval: TimeInterval, $resolution: ReadResolution, $saUuid: String) {
+      billingAccountByAuthContext(forceLegacyData: true) {
+        serviceAgreementsConnection(onlyActive: true, matching: $saUuid) {
+          edges {
+            node {
+              servicePointsConnection {
+                edges {
+                  node {
+                    readStreams(timeInterval: $timeInterval, readResolution: $resolution) {
+                      netUsage {
+                        reads {
+                          timeInterval
+                          measuredAmount { value }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+
     def __init__(
         self,
         username: str,
@@ -777,16 +810,96 @@ class OpowerClient:
 
         return resp.json()
 
+    @staticmethod
+    def _first_node(connection: Optional[dict]) -> dict:
+        """Get the node of the first edge in a GraphQL connection (or {})."""
+        edges = (connection or {}).get("edges") or []
+        return (edges[0].get("node") or {}) if edges else {}
+
+    @classmethod
+    def _first_netusage_reads(cls, result: dict) -> list:
+        """Get the netUsage reads of the first service point in a read query.
+
+        Navigates data -> billingAccountByAuthContext -> serviceAgreementsConnection
+        -> servicePointsConnection -> readStreams -> netUsage[0] -> reads.
+        """
+        data = result.get("data") or {}
+        billing = data.get("billingAccountByAuthContext") or {}
+        sa_node = cls._first_node(billing.get("serviceAgreementsConnection"))
+        sp_node = cls._first_node(sa_node.get("servicePointsConnection"))
+        read_streams = sp_node.get("readStreams") or {}
+        net_usage = read_streams.get("netUsage") or []
+        return (net_usage[0].get("reads") or []) if net_usage else []
+
+    @staticmethod
+    def _parse_interval_start(interval: Optional[str]) -> Optional[datetime]:
+        """Parse the start of an ISO 8601 interval, or None if unparseable.
+
+        Format: "2025-12-16T00:00:00-06:00/2025-12-17T00:00:00-06:00"
+        """
+        if not interval:
+            return None
+        try:
+            return datetime.fromisoformat(interval.split("/")[0])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _as_aware(dt: Optional[datetime]) -> Optional[datetime]:
+        """Treat a naive datetime as Chicago time so it compares with parsed read times.
+
+        Uses the same fixed -06:00 offset that _format_time_interval() applies
+        to naive start/end dates, so since lines up with the requested range.
+        """
+        if dt is not None and dt.tzinfo is None:
+            return dt.replace(tzinfo=CHICAGO_OFFSET)
+        return dt
+
+    @staticmethod
+    def _months_before(dt: datetime, months: int) -> datetime:
+        """Go back a number of calendar months, clamping to the month's last day.
+
+        e.g. 11 months before 2025-12-31 is 2025-01-31, and 1 month before
+        2025-03-31 is 2025-02-28.
+        """
+        month_index = dt.year * 12 + (dt.month - 1) - months
+        year, month = divmod(month_index, 12)
+        month += 1
+        day = min(dt.day, calendar.monthrange(year, month)[1])
+        return dt.replace(year=year, month=month, day=day)
+
     def _format_time_interval(self, start: datetime, end: datetime) -> str:
         """Format time interval as ISO 8601 interval."""
         tz_offset = "-06:00"  # Chicago timezone
         return f"{start.strftime('%Y-%m-%dT%H:%M:%S')}{tz_offset}/{end.strftime('%Y-%m-%dT%H:%M:%S')}{tz_offset}"
 
+    async def _fetch_usage_reads(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: str
+    ) -> list:
+        """Run the usage query and return the raw netUsage reads ([] on parse errors)."""
+        variables = {
+            "resolution": resolution,
+            "timeInterval": self._format_time_interval(start_date, end_date),
+            "saUuid": self.utility_account_uuid,
+        }
+
+        result = await self._graphql_query(self.USAGE_QUERY, variables)
+
+        try:
+            return self._first_netusage_reads(result)
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Error parsing usage data: {e}")
+            return []
+
     async def get_usage_data(
         self,
         start_date: datetime,
         end_date: datetime,
-        resolution: str = "DAY"
+        resolution: str = "DAY",
+        since: Optional[datetime] = None,
     ) -> List[OpowerUsageRead]:
         """Get energy usage data.
 
@@ -794,93 +907,112 @@ class OpowerClient:
             start_date: Start of date range
             end_date: End of date range
             resolution: "DAY", "HOUR", or "HALF_HOUR"
+            since: Only return reads that start after this time (naive = Chicago time)
 
         Returns:
             List of OpowerUsageRead objects
         """
-        query = """
-        query GetUsageReads($timeInterval: TimeInterval, $resolution: ReadResolution, $saUuid: String) {
-          billingAccountByAuthContext(forceLegacyData: true) {
-            serviceAgreementsConnection(onlyActive: true, matching: $saUuid) {
-              edges {
-                node {
-                  servicePointsConnection {
-                    edges {
-                      node {
-                        readStreams(timeInterval: $timeInterval, readResolution: $resolution) {
-                          netUsage {
-                            unit
-                            reads {
-                              timeInterval
-                              measuredAmount { value }
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+        return [
+            read async for read in self.iter_usage_data(start_date, end_date, resolution, since)
+        ]
 
-        variables = {
-            "resolution": resolution,
-            "timeInterval": self._format_time_interval(start_date, end_date),
-            "saUuid": self.utility_account_uuid,
-        }
+    async def iter_usage_data(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: str = "DAY",
+        since: Optional[datetime] = None,
+    ) -> AsyncIterator[OpowerUsageRead]:
+        """Iterate over energy usage data one read at a time.
 
-        result = await self._graphql_query(query, variables)
+        Same as get_usage_data(), but yields each OpowerUsageRead as it is
+        parsed so callers that only persist the reads never hold the whole
+        range in memory.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            resolution: "DAY", "HOUR", or "HALF_HOUR"
+            since: Only yield reads that start after this time (naive = Chicago time)
+
+        Yields:
+            OpowerUsageRead objects
+        """
+        raw_reads = await self._fetch_usage_reads(start_date, end_date, resolution)
+        since = self._as_aware(since)
 
         # Parse response - use safe navigation
-        reads = []
         try:
-            data = result.get("data") or {}
-            billing = data.get("billingAccountByAuthContext") or {}
-            sa_conn = billing.get("serviceAgreementsConnection") or {}
-            sa_edges = sa_conn.get("edges") or []
-            sa_node = sa_edges[0].get("node") if sa_edges else {} or {}
-            sp_conn = sa_node.get("servicePointsConnection") or {}
-            sp_edges = sp_conn.get("edges") or []
-            sp_node = sp_edges[0].get("node") if sp_edges else {} or {}
-            read_streams = sp_node.get("readStreams") or {}
-            net_usage = read_streams.get("netUsage") or []
-            raw_reads = net_usage[0].get("reads") if net_usage else [] or []
-
             for read in raw_reads:
-                interval = read.get("timeInterval", "")
+                timestamp = self._parse_interval_start(read.get("timeInterval", ""))
+                # Skip reads we already have before building the model
+                if since is not None and timestamp and timestamp <= since:
+                    continue
+
                 measured = read.get("measuredAmount") or {}
                 kwh = measured.get("value", 0) or 0
 
-                # Parse timestamp
-                timestamp = None
-                if interval:
-                    try:
-                        # Format: "2025-12-16T00:00:00-06:00/2025-12-17T00:00:00-06:00"
-                        start_str = interval.split("/")[0]
-                        timestamp = datetime.fromisoformat(start_str)
-                    except (ValueError, IndexError):
-                        pass
-
                 if timestamp:
-                    reads.append(OpowerUsageRead(
+                    yield OpowerUsageRead(
                         timestamp=timestamp,
                         kwh=kwh,
                         resolution=resolution,
-                    ))
+                    )
 
         except (KeyError, IndexError, TypeError, AttributeError) as e:
             logger.warning(f"Error parsing usage data: {e}")
 
-        return reads
+    async def get_usage_array(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: str = "DAY"
+    ) -> OpowerUsageArray:
+        """Get energy usage data in columnar form.
+
+        Same data as get_usage_data(), but parsed straight into typed arrays
+        instead of one model per read. Use for large ranges (e.g. a year of
+        HALF_HOUR reads) or when only totals are needed; call to_records()
+        on the result for the list-of-models shape.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            resolution: "DAY", "HOUR", or "HALF_HOUR"
+
+        Returns:
+            OpowerUsageArray (empty on parse errors)
+        """
+        raw_reads = await self._fetch_usage_reads(start_date, end_date, resolution)
+
+        try:
+            # Pre-allocate columns and fill by index
+            timestamps = array("q", [0]) * len(raw_reads)
+            kwh_values = array("d", [0.0]) * len(raw_reads)
+            count = 0
+            for read in raw_reads:
+                timestamp = self._parse_interval_start(read.get("timeInterval", ""))
+                if timestamp:
+                    measured = read.get("measuredAmount") or {}
+                    timestamps[count] = int(timestamp.timestamp())
+                    kwh_values[count] = measured.get("value", 0) or 0
+                    count += 1
+
+            # Drop slots left by unparseable reads
+            del timestamps[count:]
+            del kwh_values[count:]
+            return OpowerUsageArray(timestamps, kwh_values, resolution)
+
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Error parsing usage data: {e}")
+            return OpowerUsageArray(array("q"), array("d"), resolution)
 
     async def get_cost_data(
         self,
         start_date: datetime,
         end_date: datetime,
-        resolution: str = "DAY"
+        resolution: str = "DAY",
+        since: Optional[datetime] = None,
     ) -> List[OpowerCostRead]:
         """Get energy cost data.
 
@@ -888,6 +1020,7 @@ class OpowerClient:
             start_date: Start of date range
             end_date: End of date range
             resolution: "DAY" or "HOUR"
+            since: Only return reads that start after this time (naive = Chicago time)
 
         Returns:
             List of OpowerCostRead objects
@@ -904,11 +1037,10 @@ class OpowerClient:
                       node {
                         readStreams(timeInterval: $timeInterval, readResolution: $resolution) {
                           netUsage {
-                            unit
                             reads {
                               timeInterval
                               measuredAmount { value }
-                              monetaryAmount { value currency }
+                              monetaryAmount { value }
                             }
                           }
                         }
@@ -929,37 +1061,24 @@ class OpowerClient:
         }
 
         result = await self._graphql_query(query, variables)
+        since = self._as_aware(since)
 
         # Parse response - use safe navigation
         reads = []
         try:
-            data = result.get("data") or {}
-            billing = data.get("billingAccountByAuthContext") or {}
-            sa_conn = billing.get("serviceAgreementsConnection") or {}
-            sa_edges = sa_conn.get("edges") or []
-            sa_node = sa_edges[0].get("node") if sa_edges else {} or {}
-            sp_conn = sa_node.get("servicePointsConnection") or {}
-            sp_edges = sp_conn.get("edges") or []
-            sp_node = sp_edges[0].get("node") if sp_edges else {} or {}
-            read_streams = sp_node.get("readStreams") or {}
-            net_usage = read_streams.get("netUsage") or []
-            raw_reads = net_usage[0].get("reads") if net_usage else [] or []
+            raw_reads = self._first_netusage_reads(result)
 
             for read in raw_reads:
-                interval = read.get("timeInterval", "")
+                timestamp = self._parse_interval_start(read.get("timeInterval", ""))
+                # Skip reads we already have before building the model
+                if since is not None and timestamp and timestamp <= since:
+                    continue
+
                 measured = read.get("measuredAmount") or {}
                 monetary = read.get("monetaryAmount") or {}
                 kwh = measured.get("value", 0) or 0
                 cost = monetary.get("value", 0) or 0
 
-                timestamp = None
-                if interval:
-                    try:
-                        start_str = interval.split("/")[0]
-                        timestamp = datetime.fromisoformat(start_str)
-                    except (ValueError, IndexError):
-                        pass
-
                 if timestamp:
                     reads.append(OpowerCostRead(
                         timestamp=timestamp,
@@ -978,18 +1097,13 @@ class OpowerClient:
         query = """
         query WDB_GetMetadata($forceLegacyData: Boolean, $first: Int, $lastForServicePoints: Int, $aliased: Boolean) {
           billingAccountByAuthContext(forceLegacyData: $forceLegacyData) {
-            customerClass
-            uuid
             serviceAgreementsConnection(first: $first, onlyActive: true, aliased: $aliased) {
               edges {
                 node {
-                  uuid
-                  serviceType
                   ratePlan { code }
                   servicePointsConnection(last: $lastForServicePoints) {
                     edges {
                       node {
-                        uuid
                         premise {
                           timeZone
                         }
@@ -1019,16 +1133,12 @@ class OpowerClient:
         try:
             data = result.get("data") or {}
             billing = data.get("billingAccountByAuthContext") or {}
-            sa_conn = billing.get("serviceAgreementsConnection") or {}
-            sa_edges = sa_conn.get("edges") or []
-            sa = sa_edges[0].get("node") if sa_edges else {} or {}
+            sa = self._first_node(billing.get("serviceAgreementsConnection"))
 
             rate_plan_obj = sa.get("ratePlan") or {}
             rate_plan = rate_plan_obj.get("code")
 
-            sp_conn = sa.get("servicePointsConnection") or {}
-            sp_edges = sp_conn.get("edges") or []
-            sp = sp_edges[0].get("node") if sp_edges else {} or {}
+            sp = self._first_node(sa.get("servicePointsConnection"))
 
             registers_list = sp.get("registers") or []
             registers = registers_list[0] if registers_list else {}
@@ -1075,7 +1185,7 @@ class OpowerClient:
         """
 
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=months * 30)
+        start_date = self._months_before(end_date, months)
 
         variables = {
             "last": months,
@@ -1099,13 +1209,7 @@ class OpowerClient:
 
                 # Parse usage interval
                 interval = segment.get("usageInterval", "")
-                bill_date = None
-                if interval:
-                    try:
-                        start_str = interval.split("/")[0]
-                        bill_date = datetime.fromisoformat(start_str)
-                    except (ValueError, IndexError):
-                        pass
+                bill_date = self._parse_interval_start(interval)
 
                 # Get total kWh from service quantities
                 total_kwh = 0
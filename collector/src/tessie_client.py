@@ -10,87 +10,231 @@ Tessie provides access to Tesla's Fleet API with additional enhancements:
 API Documentation: https://developer.tessie.com/reference
 """
 
-import aiohttp
 import asyncio
+import bisect
+import httpx
 import logging
-from typing import Optional, List
-from .models import TessieVehicle, TessieChargeState, TessieCharge, FleetEnergySiteLiveStatus, FleetWallConnector, FleetChargeSession
+import orjson
+import time
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter
+from typing import AsyncIterator, Dict, Optional, List, Tuple
+from pydantic import TypeAdapter, ValidationError
+from .models import TessieVehicle, TessieChargeState, TessieCharge, FleetEnergySiteLiveStatus, FleetWallConnector, FleetChargeSession, FleetChargeSessionArray
 
 logger = logging.getLogger(__name__)
 
+# Map timezone names to offsets (common ones) for Fleet API date strings
+TZ_OFFSETS = {
+    "America/Chicago": "-06:00",
+    "America/New_York": "-05:00",
+    "America/Los_Angeles": "-08:00",
+    "America/Denver": "-07:00",
+    "UTC": "+00:00",
+}
+
+_START_TIMESTAMP = attrgetter("start_timestamp")
+
+# Validates a whole telemetry_history charge_history list in one call
+_CHARGE_HISTORY_ADAPTER = TypeAdapter(List[FleetChargeSession])
+
+# Rows per validation pass in iter_charge_sessions(): big enough for the
+# one-call validator to pay off, small enough to bound the models built ahead
+_CHARGE_HISTORY_CHUNK = 256
+
+
+def _validate_charge_history(charge_history: list) -> List[FleetChargeSession]:
+    """Validate a charge_history list, logging and dropping malformed rows.
+
+    The whole list is validated in one pass. If any row fails, the failing
+    indices are taken from the error and only the remaining rows are
+    validated again, so one bad row doesn't discard the whole window.
+    """
+    try:
+        return _CHARGE_HISTORY_ADAPTER.validate_python(charge_history)
+    except ValidationError as e:
+        bad = {err["loc"][0] for err in e.errors() if err["loc"]}
+        logger.error(
+            "Fleet API: Skipping %d malformed charge session(s): %s", len(bad), e
+        )
+
+    rows = [row for i, row in enumerate(charge_history) if i not in bad]
+    try:
+        return _CHARGE_HISTORY_ADAPTER.validate_python(rows)
+    except ValidationError as e:
+        logger.error("Fleet API: Error parsing charge sessions: %s", e)
+        return []
+
+
+def _has_charge(energy_wh: float, duration_s: int) -> bool:
+    """Whether a session recorded any charging (zero energy/duration is invalid data)."""
+    return energy_wh > 0 and duration_s > 0
+
+
+def _backoff_key(endpoint: str) -> str:
+    """Backoff scope for an endpoint: its first path segment ("/{vin}", "/api", ...)."""
+    return "/" + endpoint.split("/", 2)[1]
+
 
 class TessieClient:
     """Async client for Tessie API."""
 
     BASE_URL = "https://api.tessie.com"
 
-    def __init__(self, access_token: str, timeout: int = 30):
+    SITE_IDS_CACHE_TTL = 3600  # seconds
+
+    # Backoff after 429 doubles from the initial delay up to the max; 408 is fixed
+    RATE_LIMIT_BACKOFF_INITIAL = 10.0  # seconds
+    RATE_LIMIT_BACKOFF_MAX = 300.0  # seconds
+    ASLEEP_BACKOFF = 60.0  # seconds
+
+    # Known non-200 statuses -> (log level, message); anything else gets a generic warning
+    _ERROR_HANDLERS = {
+        401: (logging.ERROR, "Tessie API: Authentication failed - check your access token"),
+        429: (logging.WARNING, "Tessie API: Rate limited - backing off"),
+        408: (logging.WARNING, "Tessie API: Vehicle is asleep or unavailable"),
+    }
+
+    def __init__(self, access_token: str, timeout: int = 30, state_cache_ttl: float = 5.0):
         """Initialize Tessie client.
 
         Args:
             access_token: Tessie API access token from dash.tessie.com/settings/api
             timeout: Request timeout in seconds
+            state_cache_ttl: Seconds a /{vin}/state response is reused across
+                get_vehicle_state/get_charge_state/get_location calls
         """
         self.access_token = access_token
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.timeout = httpx.Timeout(timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # VIN -> (monotonic fetch time, raw state response)
+        self.state_cache_ttl = state_cache_ttl
+        self._state_cache: Dict[str, Tuple[float, dict]] = {}
+        self._state_locks: Dict[str, asyncio.Lock] = {}
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with auth headers."""
-        if self._session is None or self._session.closed:
+        # Energy site IDs rarely change, so /api/1/products is only re-read hourly
+        self._site_ids_cache: Optional[List[str]] = None
+        self._site_ids_expiry: float = 0
+
+        # Endpoint prefix (e.g. "/{vin}") -> monotonic time polling may resume,
+        # and the last 429 delay used for that prefix
+        self._backoff_until: Dict[str, float] = {}
+        self._backoff_delay: Dict[str, float] = {}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP/2 client with auth headers.
+
+        All Tessie/Fleet API calls go to one host, so HTTP/2 lets concurrent
+        requests multiplex over a single TLS connection.
+        """
+        if self._client is None or self._client.is_closed:
             headers = {
                 "Authorization": f"Bearer {self.access_token}",
                 "Accept": "application/json",
             }
-            self._session = aiohttp.ClientSession(
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                http2=True,
+                headers=headers,
                 timeout=self.timeout,
-                headers=headers
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
             )
-        return self._session
+        return self._client
 
     async def close(self):
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
 
-    async def _fetch(self, endpoint: str, params: Optional[dict] = None) -> Optional[dict]:
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        backoff: bool = True
+    ) -> Optional[dict]:
         """Fetch data from Tessie API endpoint.
 
+        After a 429 (rate limited) or 408 (vehicle asleep), further requests under
+        the same endpoint prefix return None without hitting the API until the
+        backoff expires. A 200 clears the backoff for that prefix.
+
         Args:
             endpoint: API endpoint path (e.g., "/vehicles")
             params: Optional query parameters
+            backoff: If False, send the request even while the prefix is backing
+                off (used for wake and commands)
 
         Returns:
             JSON response as dict, or None on error
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        key = _backoff_key(endpoint)
+        if backoff and time.monotonic() < self._backoff_until.get(key, 0):
+            logger.debug("Tessie API: Backing off, skipping %s", endpoint)
+            return None
+
         try:
-            session = await self._get_session()
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 401:
-                    logger.error("Tessie API: Authentication failed - check your access token")
-                    return None
-                elif response.status == 429:
-                    logger.warning("Tessie API: Rate limited - backing off")
-                    return None
-                elif response.status == 408:
-                    logger.warning("Tessie API: Vehicle is asleep or unavailable")
-                    return None
-                else:
-                    logger.warning(f"Tessie API: HTTP {response.status} from {endpoint}")
-                    return None
-        except asyncio.TimeoutError:
-            logger.error(f"Tessie API: Timeout fetching {endpoint}")
+            client = await self._get_client()
+            response = await client.get(endpoint, params=params)
+            if response.status_code == 200:
+                if key in self._backoff_until:
+                    del self._backoff_until[key]
+                    self._backoff_delay.pop(key, None)
+                return orjson.loads(response.content)
+            if response.status_code == 429:
+                delay = min(
+                    self._backoff_delay.get(key, self.RATE_LIMIT_BACKOFF_INITIAL / 2) * 2,
+                    self.RATE_LIMIT_BACKOFF_MAX
+                )
+                self._backoff_delay[key] = delay
+                self._backoff_until[key] = time.monotonic() + delay
+            elif response.status_code == 408:
+                self._backoff_until[key] = time.monotonic() + self.ASLEEP_BACKOFF
+            handler = self._ERROR_HANDLERS.get(response.status_code)
+            if handler:
+                level, message = handler
+                logger.log(level, message)
+            else:
+                logger.warning("Tessie API: HTTP %s from %s", response.status_code, endpoint)
+            return None
+        except httpx.TimeoutException:
+            logger.error("Tessie API: Timeout fetching %s", endpoint)
             return None
-        except aiohttp.ClientError as e:
-            logger.error(f"Tessie API: Error fetching {endpoint}: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Tessie API: Error fetching %s: %s", endpoint, e)
             return None
         except Exception as e:
-            logger.error(f"Tessie API: Unexpected error fetching {endpoint}: {e}")
+            logger.error("Tessie API: Unexpected error fetching %s: %s", endpoint, e)
             return None
 
+    async def _get_state_raw(self, vin: str) -> Optional[dict]:
+        """Get the raw /{vin}/state response, reusing it for state_cache_ttl seconds.
+
+        Concurrent callers for the same VIN share one in-flight request.
+
+        Args:
+            vin: Vehicle Identification Number
+
+        Returns:
+            JSON response as dict, or None on error
+        """
+        cached = self._state_cache.get(vin)
+        if cached and time.monotonic() - cached[0] < self.state_cache_ttl:
+            return cached[1]
+
+        lock = self._state_locks.setdefault(vin, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the cache while we waited
+            cached = self._state_cache.get(vin)
+            if cached and time.monotonic() - cached[0] < self.state_cache_ttl:
+                return cached[1]
+
+            data = await self._fetch(f"/{vin}/state")
+            if data:
+                self._state_cache[vin] = (time.monotonic(), data)
+            return data
+
     async def get_vehicles(self, only_active: bool = True) -> List[TessieVehicle]:
         """Get all vehicles associated with the account.
 
@@ -111,7 +255,7 @@ class TessieClient:
             try:
                 vehicles.append(TessieVehicle.from_api_response(vehicle_data))
             except Exception as e:
-                logger.error(f"Tessie API: Error parsing vehicle data: {e}")
+                logger.error("Tessie API: Error parsing vehicle data: %s", e)
 
         return vehicles
 
@@ -126,7 +270,7 @@ class TessieClient:
         Returns:
             TessieVehicle with current state, or None on error
         """
-        data = await self._fetch(f"/{vin}/state")
+        data = await self._get_state_raw(vin)
 
         if not data:
             return None
@@ -134,9 +278,23 @@ class TessieClient:
         try:
             return TessieVehicle.from_api_response(data)
         except Exception as e:
-            logger.error(f"Tessie API: Error parsing vehicle state for {vin}: {e}")
+            logger.error("Tessie API: Error parsing vehicle state for %s: %s", vin, e)
             return None
 
+    async def get_all_states(self, vins: List[str]) -> Dict[str, Optional[TessieVehicle]]:
+        """Get current state for several vehicles concurrently.
+
+        Args:
+            vins: Vehicle Identification Numbers
+
+        Returns:
+            Dict of VIN -> TessieVehicle (None for vehicles that failed), in vins order
+        """
+        # get_vehicle_state logs and returns None on failure, so tasks don't raise
+        async with asyncio.TaskGroup() as tg:
+            tasks = {vin: tg.create_task(self.get_vehicle_state(vin)) for vin in vins}
+        return {vin: task.result() for vin, task in tasks.items()}
+
     async def get_charge_state(self, vin: str) -> Optional[TessieChargeState]:
         """Get current charge state for a vehicle.
 
@@ -147,7 +305,7 @@ class TessieClient:
             TessieChargeState, or None on error
         """
         # The state endpoint includes charge_state
-        data = await self._fetch(f"/{vin}/state")
+        data = await self._get_state_raw(vin)
 
         if not data or "charge_state" not in data:
             return None
@@ -155,7 +313,7 @@ class TessieClient:
         try:
             return TessieChargeState.from_api_response(data["charge_state"])
         except Exception as e:
-            logger.error(f"Tessie API: Error parsing charge state for {vin}: {e}")
+            logger.error("Tessie API: Error parsing charge state for %s: %s", vin, e)
             return None
 
     async def get_charges(
@@ -194,7 +352,7 @@ class TessieClient:
             try:
                 charges.append(TessieCharge.from_api_response(charge_data))
             except Exception as e:
-                logger.error(f"Tessie API: Error parsing charge data: {e}")
+                logger.error("Tessie API: Error parsing charge data: %s", e)
 
         return charges
 
@@ -207,7 +365,7 @@ class TessieClient:
         Returns:
             Dict with latitude, longitude, heading, or None
         """
-        data = await self._fetch(f"/{vin}/state")
+        data = await self._get_state_raw(vin)
 
         if not data or "drive_state" not in data:
             return None
@@ -231,7 +389,7 @@ class TessieClient:
         Returns:
             True if wake command was successful
         """
-        data = await self._fetch(f"/{vin}/wake")
+        data = await self._fetch(f"/{vin}/wake", backoff=False)
         return data is not None and data.get("result", False)
 
     # Charge control methods (for Phase 4.4)
@@ -244,7 +402,7 @@ class TessieClient:
         Returns:
             True if command was successful
         """
-        data = await self._fetch(f"/{vin}/command/start_charging")
+        data = await self._fetch(f"/{vin}/command/start_charging", backoff=False)
         return data is not None and data.get("result", False)
 
     async def stop_charging(self, vin: str) -> bool:
@@ -256,7 +414,7 @@ class TessieClient:
         Returns:
             True if command was successful
         """
-        data = await self._fetch(f"/{vin}/command/stop_charging")
+        data = await self._fetch(f"/{vin}/command/stop_charging", backoff=False)
         return data is not None and data.get("result", False)
 
     async def set_charge_limit(self, vin: str, percent: int) -> bool:
@@ -270,7 +428,9 @@ class TessieClient:
             True if command was successful
         """
         percent = max(50, min(100, percent))  # Clamp to valid range
-        data = await self._fetch(f"/{vin}/command/set_charge_limit?percent={percent}")
+        data = await self._fetch(
+            f"/{vin}/command/set_charge_limit", params={"percent": percent}, backoff=False
+        )
         return data is not None and data.get("result", False)
 
     async def set_charging_amps(self, vin: str, amps: int) -> bool:
@@ -283,7 +443,9 @@ class TessieClient:
         Returns:
             True if command was successful
         """
-        data = await self._fetch(f"/{vin}/command/set_charging_amps?amps={amps}")
+        data = await self._fetch(
+            f"/{vin}/command/set_charging_amps", params={"amps": amps}, backoff=False
+        )
         return data is not None and data.get("result", False)
 
     # =========================================================================
@@ -306,9 +468,15 @@ class TessieClient:
     async def get_energy_site_ids(self) -> List[str]:
         """Get list of energy site IDs from the account.
 
+        Results are cached for SITE_IDS_CACHE_TTL seconds; call
+        invalidate_site_ids() to force a fresh lookup.
+
         Returns:
             List of energy_site_id strings
         """
+        if self._site_ids_cache is not None and time.monotonic() < self._site_ids_expiry:
+            return list(self._site_ids_cache)
+
         data = await self.get_products()
         if not data or "response" not in data:
             return []
@@ -318,7 +486,14 @@ class TessieClient:
             if "energy_site_id" in product:
                 site_ids.append(str(product["energy_site_id"]))
 
-        return site_ids
+        self._site_ids_cache = site_ids
+        self._site_ids_expiry = time.monotonic() + self.SITE_IDS_CACHE_TTL
+        return list(site_ids)
+
+    def invalidate_site_ids(self) -> None:
+        """Drop the cached energy site IDs so the next lookup hits the API."""
+        self._site_ids_cache = None
+        self._site_ids_expiry = 0
 
     async def get_energy_site_live_status(
         self,
@@ -340,7 +515,7 @@ class TessieClient:
         try:
             return FleetEnergySiteLiveStatus.from_api_response(data)
         except Exception as e:
-            logger.error(f"Fleet API: Error parsing live_status for site {energy_site_id}: {e}")
+            logger.error("Fleet API: Error parsing live_status for site %s: %s", energy_site_id, e)
             return None
 
     async def get_wall_connectors(
@@ -349,7 +524,8 @@ class TessieClient:
     ) -> List[FleetWallConnector]:
         """Get Wall Connector data for an energy site.
 
-        Convenience method that returns just the wall connector list.
+        Convenience method that returns just the wall connector list, without
+        building the full FleetEnergySiteLiveStatus.
 
         Args:
             energy_site_id: The energy site ID
@@ -357,12 +533,16 @@ class TessieClient:
         Returns:
             List of FleetWallConnector objects
         """
-        status = await self.get_energy_site_live_status(energy_site_id)
+        data = await self._fetch(f"/api/1/energy_sites/{energy_site_id}/live_status")
 
-        if status:
-            return status.wall_connectors
+        if not data:
+            return []
 
-        return []
+        try:
+            return FleetEnergySiteLiveStatus.parse_wall_connectors_only(data)
+        except Exception as e:
+            logger.error("Fleet API: Error parsing live_status for site %s: %s", energy_site_id, e)
+            return []
 
     async def get_energy_site_info(self, energy_site_id: str) -> Optional[dict]:
         """Get site info for an energy site.
@@ -398,37 +578,28 @@ class TessieClient:
         Returns:
             Raw API response with telemetry history, or None on error
         """
-        from datetime import datetime, timedelta
-        import urllib.parse
-
-        # Map timezone names to offsets (common ones)
-        tz_offsets = {
-            "America/Chicago": "-06:00",
-            "America/New_York": "-05:00",
-            "America/Los_Angeles": "-08:00",
-            "America/Denver": "-07:00",
-            "UTC": "+00:00",
-        }
-        tz_offset = tz_offsets.get(time_zone, "-06:00")
+        tz_offset = TZ_OFFSETS.get(time_zone, "-06:00")
 
         # Default to last 7 days if not specified
         # Fleet API requires ISO 8601 format with timezone
         if not end_date:
-            end_date = datetime.now().strftime(f"%Y-%m-%dT23:59:59{tz_offset}")
+            end_date = f"{date.today().isoformat()}T23:59:59{tz_offset}"
         elif len(end_date) == 10:  # Simple YYYY-MM-DD format
             end_date = f"{end_date}T23:59:59{tz_offset}"
 
         if not start_date:
-            start_date = (datetime.now() - timedelta(days=7)).strftime(f"%Y-%m-%dT00:00:00{tz_offset}")
+            start_date = f"{(date.today() - timedelta(days=7)).isoformat()}T00:00:00{tz_offset}"
         elif len(start_date) == 10:  # Simple YYYY-MM-DD format
             start_date = f"{start_date}T00:00:00{tz_offset}"
 
-        # URL encode the dates (they contain colons and plus signs)
-        start_encoded = urllib.parse.quote(start_date, safe='')
-        end_encoded = urllib.parse.quote(end_date, safe='')
-
-        params = f"kind={kind}&start_date={start_encoded}&end_date={end_encoded}&time_zone={time_zone}"
-        data = await self._fetch(f"/api/1/energy_sites/{energy_site_id}/telemetry_history?{params}")
+        # Dates contain colons and plus signs; httpx encodes them in params
+        params = {
+            "kind": kind,
+            "start_date": start_date,
+            "end_date": end_date,
+            "time_zone": time_zone,
+        }
+        data = await self._fetch(f"/api/1/energy_sites/{energy_site_id}/telemetry_history", params=params)
         return data
 
     async def get_energy_site_calendar_history(
@@ -453,16 +624,20 @@ class TessieClient:
         Returns:
             Raw API response with calendar history, or None on error
         """
-        from datetime import datetime, timedelta
-
         # Default to last 30 days if not specified
         if not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
+            end_date = date.today().isoformat()
         if not start_date:
-            start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-
-        params = f"kind={kind}&period={period}&start_date={start_date}&end_date={end_date}&time_zone={time_zone}"
-        data = await self._fetch(f"/api/1/energy_sites/{energy_site_id}/calendar_history?{params}")
+            start_date = (date.today() - timedelta(days=30)).isoformat()
+
+        params = {
+            "kind": kind,
+            "period": period,
+            "start_date": start_date,
+            "end_date": end_date,
+            "time_zone": time_zone,
+        }
+        data = await self._fetch(f"/api/1/energy_sites/{energy_site_id}/calendar_history", params=params)
         return data
 
     async def get_charge_sessions(
@@ -484,8 +659,142 @@ class TessieClient:
             time_zone: Timezone for the data (used if start_date/end_date are simple dates)
 
         Returns:
-            List of FleetChargeSession objects
+            List of FleetChargeSession objects, sorted by start_timestamp
         """
+        sessions = [
+            s async for s in self.iter_charge_sessions(
+                energy_site_id, start_date, end_date, time_zone
+            )
+        ]
+        # Fleet API normally returns these in order, which makes this sort ~O(n)
+        sessions.sort(key=_START_TIMESTAMP)
+
+        logger.info("Fleet API: Fetched %d charge sessions from telemetry_history", len(sessions))
+        return sessions
+
+    async def get_charge_sessions_as_arrays(
+        self,
+        energy_site_id: str,
+        start_date: str = None,
+        end_date: str = None,
+        time_zone: str = "America/Chicago"
+    ) -> FleetChargeSessionArray:
+        """Get charging sessions as typed column arrays.
+
+        Reads the numeric fields straight from the decoded charge_history
+        instead of building a FleetChargeSession per session, for large
+        backfill windows. Applies the same energy/duration filter as
+        get_charge_sessions(); din and target_id are not included.
+
+        Args:
+            energy_site_id: The energy site ID
+            start_date: Start date (YYYY-MM-DD format or ISO 8601 with timezone)
+            end_date: End date (YYYY-MM-DD format or ISO 8601 with timezone)
+            time_zone: Timezone for the data (used if start_date/end_date are simple dates)
+
+        Returns:
+            FleetChargeSessionArray (empty on error)
+        """
+        charge_history = await self._get_charge_history(
+            energy_site_id, start_date, end_date, time_zone
+        )
+
+        start_timestamps = array("q")
+        durations = array("q")
+        energies = array("d")
+        for session_data in charge_history:
+            try:
+                energy_wh = float(session_data.get("energy_added_wh", 0.0))
+                duration_s = int(session_data.get("charge_duration", {}).get("seconds", 0))
+                start_ts = int(session_data.get("charge_start_time", {}).get("seconds", 0))
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.error("Fleet API: Error parsing charge session: %s", e)
+                continue
+
+            if _has_charge(energy_wh, duration_s):
+                start_timestamps.append(start_ts)
+                durations.append(duration_s)
+                energies.append(energy_wh)
+
+        return FleetChargeSessionArray(start_timestamps, durations, energies)
+
+    async def iter_charge_sessions(
+        self,
+        energy_site_id: str,
+        start_date: str = None,
+        end_date: str = None,
+        time_zone: str = "America/Chicago"
+    ) -> AsyncIterator[FleetChargeSession]:
+        """Iterate over charging sessions from Fleet API telemetry_history.
+
+        Same sessions as get_charge_sessions() (which is built on this), in
+        API order rather than sorted. The decoded charge_history is validated
+        in chunks of _CHARGE_HISTORY_CHUNK rows and each chunk is yielded
+        before the next is validated, so large windows (backfills) never hold
+        a model for every session at once. Malformed sessions are logged and
+        skipped rather than failing the chunk.
+
+        Args:
+            energy_site_id: The energy site ID
+            start_date: Start date (YYYY-MM-DD format or ISO 8601 with timezone)
+            end_date: End date (YYYY-MM-DD format or ISO 8601 with timezone)
+            time_zone: Timezone for the data (used if start_date/end_date are simple dates)
+
+        Yields:
+            FleetChargeSession objects
+        """
+        charge_history = await self._get_charge_history(
+            energy_site_id, start_date, end_date, time_zone
+        )
+
+        for i in range(0, len(charge_history), _CHARGE_HISTORY_CHUNK):
+            chunk = charge_history[i:i + _CHARGE_HISTORY_CHUNK]
+            for session in _validate_charge_history(chunk):
+                if _has_charge(session.energy_wh, session.duration_s):
+                    yield session
+
+    async def stream_charge_sessions(
+        self,
+        energy_site_id: str,
+        queue: "asyncio.Queue[FleetChargeSession]",
+        start_date: str = None,
+        end_date: str = None,
+        time_zone: str = "America/Chicago"
+    ) -> int:
+        """Push charging sessions onto a queue for concurrent consumers.
+
+        Producer half of a producer/consumer backfill: sessions from
+        iter_charge_sessions() are put on the queue chunk by chunk as they
+        are validated, so a bounded queue (e.g. asyncio.Queue(maxsize=512)) applies
+        backpressure when DB writers fall behind. No end-of-stream marker is
+        queued; await this coroutine, then queue.join() to drain consumers.
+
+        Args:
+            energy_site_id: The energy site ID
+            queue: Queue to put FleetChargeSession objects on
+            start_date: Start date (YYYY-MM-DD format or ISO 8601 with timezone)
+            end_date: End date (YYYY-MM-DD format or ISO 8601 with timezone)
+            time_zone: Timezone for the data (used if start_date/end_date are simple dates)
+
+        Returns:
+            Number of sessions queued
+        """
+        count = 0
+        async for session in self.iter_charge_sessions(
+            energy_site_id, start_date, end_date, time_zone
+        ):
+            await queue.put(session)
+            count += 1
+        return count
+
+    async def _get_charge_history(
+        self,
+        energy_site_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        time_zone: str
+    ) -> list:
+        """Fetch the raw charge_history list from telemetry_history ([] on error)."""
         data = await self.get_energy_site_telemetry_history(
             energy_site_id=energy_site_id,
             kind="charge",
@@ -502,20 +811,7 @@ class TessieClient:
         response = data.get("response", data)
         if response is None:
             return []
-        charge_history = response.get("charge_history") or []
-
-        sessions = []
-        for session_data in charge_history:
-            try:
-                session = FleetChargeSession.from_api_response(session_data)
-                # Skip sessions with no energy (invalid data)
-                if session.energy_wh > 0 and session.duration_s > 0:
-                    sessions.append(session)
-            except Exception as e:
-                logger.error(f"Fleet API: Error parsing charge session: {e}")
-
-        logger.info(f"Fleet API: Fetched {len(sessions)} charge sessions from telemetry_history")
-        return sessions
+        return response.get("charge_history") or []
 
     async def get_charge_sessions_since(
         self,
@@ -535,17 +831,11 @@ class TessieClient:
         Returns:
             List of FleetChargeSession objects that started after since_timestamp
         """
-        from datetime import datetime, timedelta, timezone as tz
-
-        # Convert timestamp to ISO 8601 date
-        since_dt = datetime.fromtimestamp(since_timestamp, tz=tz.utc)
-        # Go back 1 day to ensure we don't miss any (we'll filter by timestamp)
-        start_dt = since_dt - timedelta(days=1)
-        end_dt = datetime.now(tz=tz.utc) + timedelta(days=1)
-
-        # Format dates in ISO 8601
-        start_date = start_dt.strftime("%Y-%m-%d")
-        end_date = end_dt.strftime("%Y-%m-%d")
+        # Convert timestamp to a UTC date, going back 1 day to ensure we
+        # don't miss any (we'll filter by timestamp)
+        since_date = datetime.fromtimestamp(since_timestamp, tz=timezone.utc).date()
+        start_date = (since_date - timedelta(days=1)).isoformat()
+        end_date = (datetime.now(tz=timezone.utc).date() + timedelta(days=1)).isoformat()
 
         sessions = await self.get_charge_sessions(
             energy_site_id=energy_site_id,
@@ -554,5 +844,6 @@ class TessieClient:
             time_zone=time_zone
         )
 
-        # Filter to only sessions that started after our threshold
-        return [s for s in sessions if s.start_timestamp > since_timestamp]
+        # Sessions are sorted by start time; keep only those after our threshold
+        cut = bisect.bisect_right(sessions, since_timestamp, key=_START_TIMESTAMP)
+        return sessions[cut:]
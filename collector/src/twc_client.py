@@ -2,14 +2,30 @@
 
 import aiohttp
 import asyncio
+import json
 import logging
+import orjson
 from typing import Optional
+from yarl import URL
 from .models import TWCVitals, TWCLifetime, TWCVersion, TWCWifiStatus
 from .config import ChargerConfig
+from .http_session import get_shared_session
 
 logger = logging.getLogger(__name__)
 
 
+def _loads(raw: bytes):
+    """Decode JSON with orjson, falling back to json for NaN/Infinity.
+
+    Some firmware emits bare NaN (seen in /api/1/lifetime), which orjson
+    rejects as invalid JSON but the stdlib parser accepts.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
 class TWCClient:
     """Async client for Tesla Wall Connector Gen 3 API."""
 
@@ -23,55 +39,71 @@ class TWCClient:
     def __init__(self, charger: ChargerConfig, timeout: int = 10):
         self.charger = charger
         self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Pre-parsed per-endpoint URLs; aiohttp uses a yarl.URL as-is instead of re-parsing a str
+        self._urls = {
+            name: URL(f"{charger.base_url}{path}") for name, path in self.ENDPOINTS.items()
+        }
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
-        return self._session
+        """Get the shared HTTP session."""
+        return await get_shared_session()
 
     async def close(self):
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release the client.
+
+        The shared HTTP session is closed separately on collector shutdown
+        via close_shared_session().
+        """
+
+    async def _fetch(self, name: str) -> Optional[dict]:
+        """Fetch data from an endpoint, by its ENDPOINTS name."""
+        raw = await self._fetch_bytes(name)
+        if raw is None:
+            return None
+        try:
+            return _loads(raw)
+        except ValueError as e:
+            logger.error(
+                "[%s] Invalid JSON from %s: %s", self.charger.name, self.ENDPOINTS[name], e
+            )
+            return None
 
-    async def _fetch(self, endpoint: str) -> Optional[dict]:
-        """Fetch data from an endpoint."""
-        url = f"{self.charger.base_url}{endpoint}"
+    async def _fetch_bytes(self, name: str) -> Optional[bytes]:
+        """Fetch the raw response body from an endpoint, by its ENDPOINTS name."""
+        url = self._urls[name]
         try:
             session = await self._get_session()
-            async with session.get(url) as response:
+            async with session.get(url, timeout=self.timeout) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.read()
                 else:
                     logger.warning(
-                        f"[{self.charger.name}] HTTP {response.status} from {endpoint}"
+                        "[%s] HTTP %s from %s", self.charger.name, response.status, url.path
                     )
                     return None
         except asyncio.TimeoutError:
-            logger.error(f"[{self.charger.name}] Timeout fetching {endpoint}")
+            logger.error("[%s] Timeout fetching %s", self.charger.name, url.path)
             return None
         except aiohttp.ClientError as e:
-            logger.error(f"[{self.charger.name}] Error fetching {endpoint}: {e}")
+            logger.error("[%s] Error fetching %s: %s", self.charger.name, url.path, e)
             return None
         except Exception as e:
-            logger.error(f"[{self.charger.name}] Unexpected error fetching {endpoint}: {e}")
+            logger.error("[%s] Unexpected error fetching %s: %s", self.charger.name, url.path, e)
             return None
 
     async def get_vitals(self) -> Optional[TWCVitals]:
         """Fetch current vitals."""
-        data = await self._fetch(self.ENDPOINTS["vitals"])
+        data = await self._fetch("vitals")
         if data:
             try:
                 return TWCVitals(**data)
             except Exception as e:
-                logger.error(f"[{self.charger.name}] Error parsing vitals: {e}")
+                logger.error("[%s] Error parsing vitals: %s", self.charger.name, e)
         return None
 
     async def get_lifetime(self) -> Optional[TWCLifetime]:
         """Fetch lifetime statistics."""
-        data = await self._fetch(self.ENDPOINTS["lifetime"])
+        data = await self._fetch("lifetime")
         if data:
             try:
                 # Handle potential 'nan' values in JSON (firmware bug)
@@ -80,42 +112,41 @@ class TWCClient:
                         data[key] = 0.0
                 return TWCLifetime(**data)
             except Exception as e:
-                logger.error(f"[{self.charger.name}] Error parsing lifetime: {e}")
+                logger.error("[%s] Error parsing lifetime: %s", self.charger.name, e)
         return None
 
     async def get_version(self) -> Optional[TWCVersion]:
         """Fetch version information."""
-        data = await self._fetch(self.ENDPOINTS["version"])
+        data = await self._fetch("version")
         if data:
             try:
                 return TWCVersion(**data)
             except Exception as e:
-                logger.error(f"[{self.charger.name}] Error parsing version: {e}")
+                logger.error("[%s] Error parsing version: %s", self.charger.name, e)
         return None
 
     async def get_wifi_status(self) -> Optional[TWCWifiStatus]:
         """Fetch WiFi status."""
-        data = await self._fetch(self.ENDPOINTS["wifi_status"])
+        data = await self._fetch("wifi_status")
         if data:
             try:
                 return TWCWifiStatus(**data)
             except Exception as e:
-                logger.error(f"[{self.charger.name}] Error parsing wifi_status: {e}")
+                logger.error("[%s] Error parsing wifi_status: %s", self.charger.name, e)
         return None
 
     async def get_all(self) -> dict:
         """Fetch all endpoints concurrently."""
-        vitals, lifetime, version, wifi = await asyncio.gather(
-            self.get_vitals(),
-            self.get_lifetime(),
-            self.get_version(),
-            self.get_wifi_status(),
-            return_exceptions=True
-        )
+        # Each getter logs and returns None on failure, so none of these raise
+        async with asyncio.TaskGroup() as tg:
+            vitals = tg.create_task(self.get_vitals())
+            lifetime = tg.create_task(self.get_lifetime())
+            version = tg.create_task(self.get_version())
+            wifi = tg.create_task(self.get_wifi_status())
 
         return {
-            "vitals": vitals if not isinstance(vitals, Exception) else None,
-            "lifetime": lifetime if not isinstance(lifetime, Exception) else None,
-            "version": version if not isinstance(version, Exception) else None,
-            "wifi_status": wifi if not isinstance(wifi, Exception) else None,
+            "vitals": vitals.result(),
+            "lifetime": lifetime.result(),
+            "version": version.result(),
+            "wifi_status": wifi.result(),
         }
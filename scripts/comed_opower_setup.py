@@ -10,10 +10,14 @@ After authentication, the cache file is saved to project root which Docker mount
 
 Requirements (install locally):
     pip install httpx
+    pip install orjson    # optional, faster JSON
+    pip install h2        # optional, enables HTTP/2
+    pip install uvloop    # optional, faster event loop (not on Windows)
 
 Usage:
     python scripts/comed_opower_setup.py              # Interactive setup
     python scripts/comed_opower_setup.py --test       # Verify setup works
+    python scripts/comed_opower_setup.py --test --live  # Verify against the API
     python scripts/comed_opower_setup.py --status     # Show current status
     python scripts/comed_opower_setup.py --force      # Force re-authentication
     python scripts/comed_opower_setup.py --mfa-method sms  # Use SMS for MFA
@@ -24,12 +28,39 @@ See docs/COMED_OPOWER_SETUP.md for detailed instructions.
 import argparse
 import asyncio
 import base64
+import functools
+import inspect
 import json
+import os
 import re
 import sys
+import threading
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from getpass import getpass
 from pathlib import Path
 from urllib.parse import urlencode
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; fall back to stdlib json
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        # Match orjson's native datetime output (ISO 8601)
+        return json.dumps(obj, indent=2, default=datetime.isoformat).encode()
 
 # Determine script location and project root
 SCRIPT_DIR = Path(__file__).parent
@@ -38,6 +69,12 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 # Cache file location - in project root (mounted into Docker as /app/)
 CACHE_FILE = PROJECT_ROOT / ".comed_opower_cache.json"
 
+# ComEd's local time zone, for Opower date ranges
+try:
+    COMED_TZ = ZoneInfo("America/Chicago")
+except ZoneInfoNotFoundError:  # Windows without the tzdata package
+    COMED_TZ = timezone(timedelta(hours=-6))
+
 # Azure AD B2C endpoints
 B2C_BASE = "https://secure1.comed.com/euazurecomed.onmicrosoft.com/B2C_1A_SignIn"
 B2C_POLICY = "B2C_1A_SignIn"
@@ -53,6 +90,28 @@ DEFAULT_HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
+# Treat tokens as expired this many seconds early, so a request sent just
+# before expiry doesn't arrive after it (same default as httpx_auth)
+EARLY_EXPIRY_SECS = 30
+
+# B2C page scraping patterns. Each is an alternation of the known page
+# formats, so the HTML is scanned once; the first match in the page wins.
+_CSRF_RE = re.compile(r'"csrf"\s*:\s*"([^"]+)"|name="csrf"\s+value="([^"]+)"')
+_TX_RE = re.compile(r'"transId"\s*:\s*"([^"]+)"|StateProperties=([^"&]+)')
+_EMAIL_RE = re.compile(
+    r'displayEmailAddress["\s:]+value["\s:]+([^"]+)"|(?i:([a-z]\*+@[a-z]+\.[a-z]+))'
+)
+_PHONE_RE = re.compile(r'displayPhoneNumber["\s:]+value["\s:]+([^"]+)"|(\*{3}-\*{3}-\d{4})')
+
+
+def _search_first(pattern: re.Pattern, html: str):
+    """Return the matched alternative's group from pattern's first match, or None."""
+    match = pattern.search(html)
+    if match:
+        return match.group(match.lastindex)
+    return None
+
+
 # Essential cookies for token refresh
 ESSENTIAL_COOKIES = {
     '.AspNet.cookie', '.AspNet.cookieC1', '.AspNet.cookieC2',
@@ -60,6 +119,103 @@ ESSENTIAL_COOKIES = {
 }
 
 
+def _new_http_client(**kwargs):
+    """Create an httpx.AsyncClient, using HTTP/2 when h2 is installed.
+
+    The auth flow makes several sequential requests per host, so keeping
+    connections alive (and multiplexing them over HTTP/2) avoids repeated
+    TLS handshakes.
+    """
+    import httpx
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0),
+        **kwargs,
+    )
+
+
+# Client shared by the connection test helpers; closed by _close_shared_client()
+_CLIENT = None
+
+
+@asynccontextmanager
+async def _shared_client():
+    """Yield the shared Opower test client, creating it on first use.
+
+    Unlike `async with httpx.AsyncClient()`, leaving the block keeps the
+    client (and its pooled connections) open for the next caller.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = _new_http_client(timeout=30.0)
+    yield _CLIENT
+
+
+async def _close_shared_client():
+    """Close the shared test client, if one was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+@functools.lru_cache(maxsize=None)
+def _opower_auth_class():
+    """Define OpowerAuth on first use so httpx stays a lazy import."""
+    import httpx
+
+    class OpowerAuth(httpx.Auth):
+        """Set the Opower Authorization header when each request is sent.
+
+        The token is read at dispatch time rather than when the headers are
+        built, so a refresh that lands in between is picked up. On a 401 the
+        optional on_unauthorized(token) callback is awaited and the request
+        is retried once with whatever token it leaves behind.
+        """
+
+        def __init__(self, get_token, on_unauthorized=None):
+            self.get_token = get_token
+            self.on_unauthorized = on_unauthorized
+
+        async def _token(self) -> str:
+            token = self.get_token()
+            return await token if inspect.isawaitable(token) else token
+
+        async def async_auth_flow(self, request):
+            token = await self._token()
+            request.headers["Authorization"] = token
+            response = yield request
+
+            if response.status_code == 401 and self.on_unauthorized is not None:
+                await self.on_unauthorized(token)
+                retry_token = await self._token()
+                if retry_token != token:
+                    request.headers["Authorization"] = retry_token
+                    yield request
+
+    return OpowerAuth
+
+
+def opower_auth(get_token, on_unauthorized=None):
+    """Build an httpx auth object for Opower API calls.
+
+    Args:
+        get_token: Callable returning the bearer token (may be async)
+        on_unauthorized: Optional async callable taking the rejected token,
+            run once before a 401 is retried
+
+    Returns:
+        OpowerAuth instance to pass as auth= on Opower requests
+    """
+    return _opower_auth_class()(get_token, on_unauthorized)
+
+
 def print_banner(text: str):
     """Print a banner with text."""
     print()
@@ -88,39 +244,158 @@ def print_info(text: str):
     print(f"[INFO] {text}")
 
 
-def load_credentials() -> tuple:
-    """Load credentials from .secrets file or environment.
+def _prompt(prompt: str) -> str:
+    """Write prompt and read one line from stdin, like input().
+
+    Skips input()'s extra stderr/stdout flushes and empty writes.
+
+    Raises:
+        EOFError: stdin is closed
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def _read_piped_credentials(username: str = None, password: str = None) -> tuple:
+    """Read whichever of username and password is missing from stdin.
+
+    Used when stdin is not a terminal. One line is read per missing value
+    (username first), and any later lines are left unread, so the MFA code
+    can still be supplied on stdin when prompted.
+
+    Args:
+        username: Username already known (not read from stdin)
+        password: Password already known (not read from stdin)
 
     Returns:
-        (username, password, bearer_token) - any may be None
+        Tuple of (username, password), empty strings for missing lines
     """
-    import os
+    readline = sys.stdin.readline
+    if not username:
+        username = readline().strip()
+    if not password:
+        password = readline().rstrip("\r\n")  # Spaces may be part of the password
+    return username, password
+
+
+def _read_in_thread(read, prompt: str) -> "asyncio.Future":
+    """Run a blocking prompt on a daemon thread, resolving a future on the loop.
+
+    The default executor isn't used because its threads are joined at
+    shutdown: Ctrl-C at a prompt would then hang until Enter was pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(value, error):
+        if future.done():  # Cancelled, e.g. by Ctrl-C
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def worker():
+        try:
+            value, error = read(prompt), None
+        except Exception as e:  # e.g. EOFError when stdin is closed
+            value, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, value, error)
+        except RuntimeError:  # Loop already closed
+            pass
+
+    threading.Thread(target=worker, name="prompt", daemon=True).start()
+    return future
+
+
+async def ainput(prompt: str) -> str:
+    """Read a stripped line of input without blocking the event loop."""
+    return (await _read_in_thread(_prompt, prompt)).strip()
+
+
+async def agetpass(prompt: str) -> str:
+    """Like ainput(), but reads a password with getpass() so it isn't echoed.
+
+    The password is returned as typed; leading/trailing spaces are legal.
+    """
+    # getpass() turns echo off; if the prompt is interrupted its own cleanup
+    # never runs (the thread is still reading), so restore the terminal here
+    tty_fd = sys.stdin.fileno() if termios is not None and sys.stdin.isatty() else None
+    tty_attrs = termios.tcgetattr(tty_fd) if tty_fd is not None else None
+    try:
+        return await _read_in_thread(getpass, prompt)
+    except BaseException:
+        if tty_attrs is not None:
+            termios.tcsetattr(tty_fd, termios.TCSAFLUSH, tty_attrs)
+            sys.stdout.write("\n")
+        raise
 
-    username = os.getenv("COMED_USERNAME")
-    password = os.getenv("COMED_PASSWORD")
-    bearer_token = os.getenv("COMED_BEARER_TOKEN")
 
-    # Try loading from .secrets file if not in environment
+async def _collect_credentials(username: str = None, password: str = None) -> tuple:
+    """Get the missing username/password from the terminal, or from piped stdin.
+
+    Args:
+        username: Username already known (e.g. from --username); not asked for
+        password: Password already known; not asked for
+
+    Returns:
+        Tuple of (username, password), empty strings for anything not given
+    """
+    if not sys.stdin.isatty():
+        # e.g. printf 'user\npass\n' | python scripts/comed_opower_setup.py
+        return _read_piped_credentials(username, password)
+
+    print("Enter your ComEd account credentials.\n")
+    if not username:
+        username = await ainput("ComEd Username (email): ")
+    if username and not password:
+        password = await agetpass("ComEd Password: ")
+    return username or "", password or ""
+
+
+@functools.lru_cache(maxsize=1)
+def _load_secrets_file() -> dict:
+    """Parse KEY=value lines from the project .secrets file (read once per run).
+
+    Returns:
+        Dict of key -> value (first occurrence wins), empty if no file
+    """
+    secrets = {}
     secrets_file = PROJECT_ROOT / ".secrets"
     if secrets_file.exists():
         try:
-            with open(secrets_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip()
-                        if key == "COMED_USERNAME" and not username:
-                            username = value
-                        elif key == "COMED_PASSWORD" and not password:
-                            password = value
-                        elif key == "COMED_BEARER_TOKEN" and not bearer_token:
-                            bearer_token = value
+            for line in secrets_file.read_text().splitlines():
+                key, sep, value = line.partition("=")
+                key = key.strip()
+                if sep and key and not key.startswith("#"):
+                    secrets.setdefault(key, value.strip())
         except Exception as e:
             print_warning(f"Could not read .secrets file: {e}")
+    return secrets
+
+
+def load_credentials() -> tuple:
+    """Load credentials from .secrets file or environment.
+
+    Returns:
+        (username, password, bearer_token) - any may be None
+    """
+    # Environment takes precedence over .secrets
+    username = os.getenv("COMED_USERNAME")
+    password = os.getenv("COMED_PASSWORD")
+    bearer_token = os.getenv("COMED_BEARER_TOKEN")
+    if username and password and bearer_token:
+        return username, password, bearer_token  # No need to read .secrets
+
+    secrets = _load_secrets_file()
+    username = username or secrets.get("COMED_USERNAME")
+    password = password or secrets.get("COMED_PASSWORD")
+    bearer_token = bearer_token or secrets.get("COMED_BEARER_TOKEN")
 
     return username, password, bearer_token
 
@@ -135,23 +410,27 @@ def check_cache() -> dict:
         return {}
 
     try:
-        cache = json.loads(CACHE_FILE.read_text())
-        expiry_str = cache.get("expiry")
-        if not expiry_str:
-            return {}
-
-        expiry = datetime.fromisoformat(expiry_str)
-        # Make timezone-aware if needed
-        if expiry.tzinfo is None:
-            expiry = expiry.replace(tzinfo=timezone.utc)
-
-        now = datetime.now(timezone.utc)
-
-        if expiry <= now:
-            return {}  # Expired
-
-        cache["_expiry_dt"] = expiry
-        cache["_time_remaining"] = (expiry - now).total_seconds()
+        cache = _json_loads(CACHE_FILE.read_bytes())
+        exp = cache.get("expiry_epoch")
+        if exp is None:
+            # Older caches only have the ISO expiry string
+            expiry_str = cache.get("expiry")
+            if not expiry_str:
+                return {}
+
+            expiry = datetime.fromisoformat(expiry_str)
+            # Make timezone-aware if needed
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)
+            exp = expiry.timestamp()
+
+        now = time.time()
+
+        if exp - EARLY_EXPIRY_SECS <= now:
+            return {}  # Expired (or about to)
+
+        cache["_expiry_dt"] = datetime.fromtimestamp(exp, tz=timezone.utc)
+        cache["_time_remaining"] = exp - now
         return cache
 
     except Exception as e:
@@ -162,14 +441,29 @@ def check_cache() -> dict:
 class ComedAuthenticator:
     """Handles ComEd authentication via Azure AD B2C."""
 
+    # Tokens within this many seconds of expiry are "stale": still usable,
+    # but get_token() starts a background refresh
+    STALE_SECS = 180
+
     def __init__(self, username: str, password: str, mfa_method: str = "email"):
         self.username = username
         self.password = password
         self.mfa_method = mfa_method.lower()
         self.client = None
+        self.opower_auth = None
 
         # B2C state
         self._csrf_token = None
+        # Request headers carrying the CSRF token, kept in sync by _set_csrf_token()
+        self._ajax_headers = {
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+            "X-CSRF-TOKEN": "",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        self._confirm_headers = {
+            "X-CSRF-TOKEN": "",
+            "X-Requested-With": "XMLHttpRequest",
+        }
         self._tx = None
         self._display_email = None
         self._display_phone = None
@@ -180,76 +474,94 @@ class ComedAuthenticator:
         self.account_uuid = None
         self.utility_account_uuid = None
 
+        # Background token refresh (one in flight at a time)
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task = None
+
     async def __aenter__(self):
-        import httpx
-        self.client = httpx.AsyncClient(
+        self.client = _new_http_client(
             follow_redirects=True,
             timeout=30.0,
             headers=DEFAULT_HEADERS,
         )
+        # Per-request auth for Opower calls; self.client also talks to ComEd
+        self.opower_auth = opower_auth(self.get_token, self._on_unauthorized)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Stop any background token refresh before its client goes away
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
         if self.client:
             await self.client.aclose()
 
     def _extract_csrf_token(self, html: str):
         """Extract CSRF token from HTML page."""
-        patterns = [
-            r'"csrf"\s*:\s*"([^"]+)"',
-            r'name="csrf"\s+value="([^"]+)"',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, html)
-            if match:
-                return match.group(1)
-        return None
+        return _search_first(_CSRF_RE, html)
 
     def _extract_tx(self, html: str):
         """Extract transaction ID (tx) from HTML page."""
-        patterns = [
-            r'"transId"\s*:\s*"([^"]+)"',
-            r'StateProperties=([^"&]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, html)
-            if match:
-                return match.group(1)
-        return None
+        return _search_first(_TX_RE, html)
 
     def _extract_mfa_options(self, html: str) -> dict:
         """Extract MFA options (email/phone) from B2C page."""
         options = {}
 
         # Extract masked email
-        email_match = re.search(r'displayEmailAddress["\s:]+value["\s:]+([^"]+)"', html)
-        if not email_match:
-            email_match = re.search(r'([a-z]\*+@[a-z]+\.[a-z]+)', html, re.IGNORECASE)
-        if email_match:
-            options['email'] = email_match.group(1)
+        email = _search_first(_EMAIL_RE, html)
+        if email:
+            options['email'] = email
 
         # Extract masked phone
-        phone_match = re.search(r'displayPhoneNumber["\s:]+value["\s:]+([^"]+)"', html)
-        if not phone_match:
-            phone_match = re.search(r'(\*{3}-\*{3}-\d{4})', html)
-        if phone_match:
-            options['phone'] = phone_match.group(1)
+        phone = _search_first(_PHONE_RE, html)
+        if phone:
+            options['phone'] = phone
 
         return options
 
+    async def _load_login_tokens(self, url: str) -> tuple:
+        """Stream the login page just far enough to find its CSRF token and TX.
+
+        Both appear near the top of the (large) page, so the download stops
+        as soon as both have been seen.
+
+        Returns:
+            (csrf_token, tx) - either may be None if not found
+        """
+        csrf_token = tx = None
+        buf = bytearray()
+        async with self.client.stream("GET", url) as resp:
+            async for chunk in resp.aiter_bytes():
+                # Search the whole buffer so a token split across chunks is still found
+                buf.extend(chunk)
+                html = buf.decode("utf-8", "ignore")
+                csrf_token = csrf_token or self._extract_csrf_token(html)
+                tx = tx or self._extract_tx(html)
+                if csrf_token and tx:
+                    break
+        return csrf_token, tx
+
     def _get_b2c_url(self, endpoint: str) -> str:
         """Build B2C URL with required query parameters."""
         tx_value = self._tx if self._tx.startswith("StateProperties=") else f"StateProperties={self._tx}"
         params = {"tx": tx_value, "p": B2C_POLICY}
         return f"{B2C_BASE}{endpoint}?{urlencode(params)}"
 
+    def _set_csrf_token(self, token: str):
+        """Store a new CSRF token and update the cached request headers."""
+        self._csrf_token = token
+        self._ajax_headers["X-CSRF-TOKEN"] = token or ""
+        self._confirm_headers["X-CSRF-TOKEN"] = token or ""
+
     def _get_ajax_headers(self) -> dict:
         """Get headers for AJAX requests."""
-        return {
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "X-CSRF-TOKEN": self._csrf_token or "",
-            "X-Requested-With": "XMLHttpRequest",
-        }
+        return self._ajax_headers
 
     async def authenticate(self, force_mfa: bool = False) -> bool:
         """Run the full authentication flow with MFA."""
@@ -265,12 +577,14 @@ class ComedAuthenticator:
                 self.account_uuid = cache.get("account_uuid")
                 return True
 
-        print("\nStep 1: Loading login page...")
-        resp = await self.client.get(f"{COMED_SECURE_BASE}/pages/login.aspx")
-        html = resp.text
+            # Token expired, but the ComEd session may still be alive
+            if await self.refresh_from_cache():
+                print_info("Refreshed token from cached session (no MFA needed)")
+                return True
 
-        self._csrf_token = self._extract_csrf_token(html)
-        self._tx = self._extract_tx(html)
+        print("\nStep 1: Loading login page...")
+        csrf_token, self._tx = await self._load_login_tokens(f"{COMED_SECURE_BASE}/pages/login.aspx")
+        self._set_csrf_token(csrf_token)
 
         if not self._csrf_token or not self._tx:
             raise Exception("Failed to extract CSRF token or TX from login page")
@@ -298,17 +612,13 @@ class ComedAuthenticator:
 
         print("Step 3: Confirming credentials...")
         url = self._get_b2c_url("/api/CombinedSigninAndSignup/confirmed")
-        headers = {
-            "X-CSRF-TOKEN": self._csrf_token or "",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        resp = await self.client.get(url, headers=headers)
+        resp = await self.client.get(url, headers=self._confirm_headers)
         html = resp.text
 
         # Update CSRF token
         new_csrf = self._extract_csrf_token(html)
         if new_csrf:
-            self._csrf_token = new_csrf
+            self._set_csrf_token(new_csrf)
 
         # Extract MFA options
         mfa_options = self._extract_mfa_options(html)
@@ -341,15 +651,11 @@ class ComedAuthenticator:
 
         print("Step 5: Confirming MFA selection...")
         url = self._get_b2c_url("/api/CombinedSigninAndSignup/confirmed")
-        headers = {
-            "X-CSRF-TOKEN": self._csrf_token or "",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        resp = await self.client.get(url, headers=headers)
+        resp = await self.client.get(url, headers=self._confirm_headers)
 
         new_csrf = self._extract_csrf_token(resp.text)
         if new_csrf:
-            self._csrf_token = new_csrf
+            self._set_csrf_token(new_csrf)
 
         print("Step 6: Requesting MFA code...")
         if self.mfa_method == "sms":
@@ -366,7 +672,7 @@ class ComedAuthenticator:
             raise Exception(f"Failed to send MFA code: {resp.status_code}")
 
         print(f"\n>>> MFA code sent to {self.mfa_method}: {destination}")
-        mfa_code = input(">>> Enter the MFA code: ").strip()
+        mfa_code = await ainput(">>> Enter the MFA code: ")
 
         if not mfa_code:
             raise Exception("MFA code is required")
@@ -418,7 +724,7 @@ class ComedAuthenticator:
         # Update CSRF from cookies
         for cookie in self.client.cookies.jar:
             if cookie.name == "x-ms-cpim-csrf":
-                self._csrf_token = cookie.value
+                self._set_csrf_token(cookie.value)
                 break
 
         print("Step 9: Completing login...")
@@ -433,7 +739,41 @@ class ComedAuthenticator:
 
         await self.client.get(confirmed_url, headers=headers, timeout=60.0)
 
+        # Open the Opower connection (TCP + TLS) while Step 10 waits on ComEd
+        prewarm = asyncio.create_task(self._prewarm(OPOWER_BASE))
+
         print("Step 10: Getting Opower token...")
+        try:
+            await self._get_opower_token()
+        finally:
+            await prewarm
+
+        # Get account info
+        print("Step 11: Getting account info...")
+        url = f"{OPOWER_BASE}/ei/edge/apis/multi-account-v1/cws/cec/customers/current"
+        resp = await self.client.get(url, auth=self.opower_auth)
+
+        if resp.status_code == 200:
+            data = resp.json()
+            self.account_uuid = data.get("uuid")
+            utility_accounts = data.get("utilityAccounts", [])
+            if utility_accounts:
+                self.utility_account_uuid = utility_accounts[0].get("uuid")
+
+        # Save cache
+        self._save_cache()
+
+        return True
+
+    async def _prewarm(self, url: str):
+        """Open a pooled connection to url's host; errors are ignored."""
+        try:
+            await self.client.head(url, follow_redirects=False, timeout=10.0)
+        except Exception:
+            pass
+
+    async def _get_opower_token(self):
+        """Exchange the current ComEd session cookies for an Opower token."""
         url = f"{COMED_SECURE_BASE}/api/Services/OpowerService.svc/GetOpowerToken"
         headers = {"Content-Type": "application/json; charset=UTF-8"}
 
@@ -449,34 +789,115 @@ class ComedAuthenticator:
 
         self.opower_token = f"Bearer {token}" if not token.startswith("Bearer") else token
 
-        # Decode token expiry
+        # Decode token expiry from the JWT payload (signature isn't checked)
         try:
-            parts = token.split(".")
-            if len(parts) >= 2:
-                payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=="))
-                exp = payload.get("exp")
-                if exp:
-                    self.token_expiry = datetime.fromtimestamp(exp, tz=timezone.utc)
+            payload = token.split(".", 2)[1]
+            padding = "=" * (-len(payload) % 4)
+            exp = _json_loads(base64.urlsafe_b64decode(payload + padding)).get("exp")
+            if exp:
+                self.token_expiry = datetime.fromtimestamp(exp, tz=timezone.utc)
         except Exception:
             self.token_expiry = datetime.now(timezone.utc) + timedelta(minutes=20)
 
-        # Get account info
-        print("Step 11: Getting account info...")
-        url = f"{OPOWER_BASE}/ei/edge/apis/multi-account-v1/cws/cec/customers/current"
-        headers = {"Authorization": self.opower_token}
+    def _token_state(self) -> str:
+        """Classify the current token as "fresh", "stale" or "expired"."""
+        if not self.opower_token:
+            return "expired"
+        if not self.token_expiry:
+            return "fresh"  # Unknown expiry; use it until the API rejects it
+        remaining = (self.token_expiry - datetime.now(timezone.utc)).total_seconds()
+        if remaining > self.STALE_SECS:
+            return "fresh"
+        if remaining > EARLY_EXPIRY_SECS:
+            return "stale"
+        return "expired"
+
+    async def get_token(self) -> str:
+        """Get a usable Opower token, refreshing it ahead of expiry.
+
+        Fresh tokens are returned as-is. Stale tokens are returned while a
+        background task refreshes them. Expired tokens are refreshed inline.
+        Refreshing reuses the cached session cookies, so no MFA is needed.
+
+        Returns:
+            Opower bearer token ("Bearer ...")
+        """
+        state = self._token_state()
+        if state == "fresh":
+            return self.opower_token
+
+        if state == "stale":
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_if_needed())
+            return self.opower_token
+
+        await self._refresh_if_needed()
+        if self._token_state() == "expired":
+            raise Exception("Opower token expired and could not be refreshed - run with --force")
+        return self.opower_token
+
+    async def _refresh_if_needed(self):
+        """Refresh the token under the lock, unless another caller already did."""
+        async with self._refresh_lock:
+            if self._token_state() == "fresh":
+                return
+            try:
+                await self._refresh()
+            except Exception as e:
+                print_warning(f"Token refresh failed: {e}")
+
+    async def _on_unauthorized(self, rejected_token: str):
+        """Replace a token the API rejected, once across concurrent callers."""
+        async with self._refresh_lock:
+            if self.opower_token != rejected_token:
+                return  # Another request already replaced it
+            try:
+                await self._get_opower_token()
+                self._save_cache()
+            except Exception as e:
+                print_warning(f"Token refresh after 401 failed: {e}")
+
+    async def _refresh(self):
+        """Get a new Opower token using the cached session cookies (Step 10 only)."""
+        if not await self.refresh_from_cache():
+            raise Exception("Cached ComEd session is no longer valid")
+
+    async def refresh_from_cache(self) -> bool:
+        """Get a new Opower token from the cached ComEd session cookies.
+
+        Restores the cached cookies and repeats only Step 10, skipping the
+        login and MFA steps. Works for as long as ComEd keeps the session
+        alive, even after the Opower token itself has expired.
+
+        Returns:
+            True if a new token was obtained and cached, False if the session
+            is gone (a full authenticate() is needed)
+        """
+        try:
+            cache = _json_loads(CACHE_FILE.read_bytes()) if CACHE_FILE.exists() else {}
+        except Exception as e:
+            print_warning(f"Could not read cache: {e}")
+            return False
 
-        resp = await self.client.get(url, headers=headers)
+        cookies = cache.get("cookies") or {}
+        if not cookies:
+            return False
 
-        if resp.status_code == 200:
-            data = resp.json()
-            self.account_uuid = data.get("uuid")
-            utility_accounts = data.get("utilityAccounts", [])
-            if utility_accounts:
-                self.utility_account_uuid = utility_accounts[0].get("uuid")
+        for name, cookie in cookies.items():
+            self.client.cookies.set(
+                name, cookie["value"], domain=cookie["domain"], path=cookie["path"]
+            )
+        self.account_uuid = self.account_uuid or cache.get("account_uuid")
+        self.utility_account_uuid = self.utility_account_uuid or cache.get("utility_account_uuid")
 
-        # Save cache
-        self._save_cache()
+        try:
+            await self._get_opower_token()
+        except Exception:
+            # Don't carry a dead session into a fresh login
+            self.client.cookies.clear()
+            return False
 
+        self._save_cache()
         return True
 
     def _save_cache(self):
@@ -493,13 +914,27 @@ class ComedAuthenticator:
 
         cache = {
             "token": self.opower_token,
-            "expiry": self.token_expiry.isoformat() if self.token_expiry else None,
+            "expiry": self.token_expiry,  # Serialized as ISO 8601
+            "expiry_epoch": self.token_expiry.timestamp() if self.token_expiry else None,
             "account_uuid": self.account_uuid,
             "utility_account_uuid": self.utility_account_uuid,
             "cookies": cookies,
         }
 
-        CACHE_FILE.write_text(json.dumps(cache, indent=2))
+        # Write to a temp file and rename over the cache, so a crash mid-write
+        # never leaves a truncated cache (the project dir is mounted, not the file)
+        tmp_file = CACHE_FILE.with_suffix(".json.tmp")
+        # Owner-only from creation, since it holds a bearer token and session
+        # cookies (the mode only applies to new files, so drop any leftover)
+        tmp_file.unlink(missing_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(cache))
+            os.replace(tmp_file, CACHE_FILE)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
         print_success(f"Session cached to: {CACHE_FILE.name}")
 
 
@@ -549,8 +984,12 @@ async def run_authentication(username: str, password: str, mfa_method: str = "em
             return False
 
 
-async def test_connection():
-    """Test that we can connect to Opower with current credentials."""
+async def test_connection(live: bool = False):
+    """Test that we can connect to Opower with current credentials.
+
+    Args:
+        live: Always call the API, even if the cached session is still fresh
+    """
     try:
         import httpx
     except ImportError:
@@ -581,12 +1020,20 @@ async def test_connection():
         remaining_min = cache.get("_time_remaining", 0) / 60
         print_info(f"Using cached session (expires in {remaining_min:.1f} minutes)")
 
+        # A fresh cached session was valid when saved; skip the round trip
+        if (not live and account_uuid
+                and cache.get("_time_remaining", 0) > ComedAuthenticator.STALE_SECS):
+            print_success("Cached session valid; skipping live check (use --live to force)")
+            print(f"  Account UUID: {account_uuid}")
+            return True
+
     # Test the token
     try:
-        async with httpx.AsyncClient() as client:
+        auth = opower_auth(lambda: token)
+        async with _shared_client() as client:
             resp = await client.get(
                 f"{OPOWER_BASE}/ei/edge/apis/multi-account-v1/cws/cec/customers/current",
-                headers={"Authorization": token},
+                auth=auth,
                 timeout=30.0
             )
 
@@ -602,7 +1049,7 @@ async def test_connection():
                     print(f"  Utility Account: {ua.get('uuid', 'unknown')[:12]}...")
 
                 # Try to fetch some usage data
-                await _test_fetch_usage(client, token, account_uuid)
+                await _test_fetch_usage(client, auth, account_uuid)
                 return True
 
             elif resp.status_code == 401:
@@ -619,11 +1066,30 @@ async def test_connection():
         return False
 
 
-async def _test_fetch_usage(client, token: str, account_uuid: str):
+# Path to the first service point's net usage reads in a GetUsageReads response
+_USAGE_READS_PATH = (
+    "data", "billingAccountByAuthContext",
+    "serviceAgreementsConnection", "edges", 0, "node",
+    "servicePointsConnection", "edges", 0, "node",
+    "readStreams", "netUsage", 0, "reads",
+)
+
+
+def _walk(obj, path: tuple):
+    """Follow dict keys / list indexes in path, returning None if any step is missing."""
+    for step in path:
+        try:
+            obj = obj[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return obj
+
+
+async def _test_fetch_usage(client, auth, account_uuid: str):
     """Helper to test fetching usage data."""
     print("\nFetching recent usage data...")
 
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc).astimezone(COMED_TZ)
     start_date = end_date - timedelta(days=7)
 
     query = """
@@ -653,8 +1119,7 @@ async def _test_fetch_usage(client, token: str, account_uuid: str):
     }
     """
 
-    tz_offset = "-06:00"  # Chicago
-    time_interval = f"{start_date.strftime('%Y-%m-%dT%H:%M:%S')}{tz_offset}/{end_date.strftime('%Y-%m-%dT%H:%M:%S')}{tz_offset}"
+    time_interval = f"{start_date.isoformat(timespec='seconds')}/{end_date.isoformat(timespec='seconds')}"
 
     try:
         resp = await client.post(
@@ -664,26 +1129,16 @@ async def _test_fetch_usage(client, token: str, account_uuid: str):
                 "variables": {"resolution": "DAY", "timeInterval": time_interval}
             },
             headers={
-                "Authorization": token,
                 "Content-Type": "application/json",
                 "opower-selected-entities": f'["urn:opower:customer:uuid:{account_uuid}"]',
             },
+            auth=auth,
             timeout=30.0
         )
 
         if resp.status_code == 200:
-            result = resp.json()
-            reads = (result.get("data", {})
-                    .get("billingAccountByAuthContext", {})
-                    .get("serviceAgreementsConnection", {})
-                    .get("edges", [{}])[0]
-                    .get("node", {})
-                    .get("servicePointsConnection", {})
-                    .get("edges", [{}])[0]
-                    .get("node", {})
-                    .get("readStreams", {})
-                    .get("netUsage", [{}])[0]
-                    .get("reads", []))
+            result = _json_loads(resp.content)
+            reads = _walk(result, _USAGE_READS_PATH) or []
 
             if reads:
                 total_kwh = sum(r.get("measuredAmount", {}).get("value", 0) or 0 for r in reads)
@@ -770,7 +1225,12 @@ def show_status():
         print("  .env file not found")
 
 
-async def main():
+async def main() -> int:
+    # Flush each line even when stdout is a pipe (tee, CI logs), so progress
+    # and instructions show up before the script blocks on a prompt
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
     parser = argparse.ArgumentParser(
         description="ComEd Opower Setup Wizard - Run locally to authenticate",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -781,75 +1241,115 @@ After authentication, copy the cache file to your Docker host.
 Examples:
   python scripts/comed_opower_setup.py              # Authenticate with MFA
   python scripts/comed_opower_setup.py --test       # Test the connection
+  python scripts/comed_opower_setup.py --test --live  # Test against the API
   python scripts/comed_opower_setup.py --status     # Show current status
   python scripts/comed_opower_setup.py --force      # Force re-authentication
   python scripts/comed_opower_setup.py --mfa-method sms  # Use SMS for MFA
 
 Requirements:
   pip install httpx
+  pip install orjson    # optional, faster JSON
+  pip install h2        # optional, enables HTTP/2
+  pip install uvloop    # optional, faster event loop (not on Windows)
 
 For detailed instructions, see docs/COMED_OPOWER_SETUP.md
         """
     )
     parser.add_argument("--test", action="store_true",
                        help="Test that the connection works")
+    parser.add_argument("--live", action="store_true",
+                       help="With --test, always call the API even if the cached session is fresh")
     parser.add_argument("--status", action="store_true",
                        help="Show current configuration status")
     parser.add_argument("--force", action="store_true",
                        help="Force re-authentication (ignore cache)")
     parser.add_argument("--mfa-method", choices=["email", "sms"], default="email",
                        help="MFA method to use (default: email)")
+    parser.add_argument("--username",
+                       help="ComEd username (default: COMED_USERNAME from env or .secrets)")
+    parser.add_argument("--password",
+                       help="ComEd password (visible in shell history; prefer COMED_PASSWORD)")
 
     args = parser.parse_args()
 
     if args.status:
         show_status()
-        return
+        return 0
 
     if args.test:
-        success = await test_connection()
-        sys.exit(0 if success else 1)
+        success = await test_connection(live=args.live)
+        return 0 if success else 1
 
-    # Check for credentials (from .secrets file or environment)
-    username, password, bearer_token = load_credentials()
+    # Check for credentials (command line, then environment, then .secrets file)
+    if args.username and args.password:
+        username, password, bearer_token = args.username, args.password, None
+    else:
+        username, password, bearer_token = load_credentials()
+        username = args.username or username
+        password = args.password or password
 
     # If no credentials found, prompt interactively
     if not username or not password:
-        if bearer_token:
+        if bearer_token and not username:
             print_banner("COMED OPOWER SETUP")
-            print("Found bearer token but no username/password.")
-            print("\nTesting the bearer token...")
-            success = await test_connection()
+            sys.stdout.write(
+                "Found bearer token but no username/password.\n"
+                "\nTesting the bearer token...\n"
+            )
+            success = await test_connection(live=True)
             if success:
-                print("\nBearer token works! However, it will expire in ~20 minutes")
-                print("and cannot be refreshed without completing MFA setup.")
+                sys.stdout.write(
+                    "\nBearer token works! However, it will expire in ~20 minutes\n"
+                    "and cannot be refreshed without completing MFA setup.\n"
+                )
+                if not sys.stdin.isatty():
+                    # Nobody to answer the prompt; don't block on piped stdin
+                    return 0
                 print("\nWould you like to complete MFA setup now for persistent operation?")
 
             # Ask if they want to continue with interactive setup
-            response = input("\nEnter your ComEd username (or press Enter to skip): ").strip()
+            response = await ainput("\nEnter your ComEd username (or press Enter to skip): ")
             if response:
                 username = response
-                password = input("Enter your ComEd password: ").strip()
+                password = await agetpass("Enter your ComEd password: ")
             else:
-                sys.exit(0 if success else 1)
+                return 0 if success else 1
         else:
             print_banner("COMED OPOWER SETUP")
-            print("Enter your ComEd account credentials.\n")
+            username, password = await _collect_credentials(username, password)
 
-            username = input("ComEd Username (email): ").strip()
             if not username:
                 print_error("Username is required")
-                sys.exit(1)
+                return 1
 
-            password = input("ComEd Password: ").strip()
             if not password:
                 print_error("Password is required")
-                sys.exit(1)
+                return 1
 
     # Run authentication
     success = await run_authentication(username, password, args.mfa_method, args.force)
-    sys.exit(0 if success else 1)
+    return 0 if success else 1
+
+
+async def _run() -> int:
+    """Run main() and close the shared HTTP client before the loop exits."""
+    try:
+        return await main()
+    finally:
+        await _close_shared_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (libuv) is a faster drop-in event loop on Linux/macOS. Imported
+    # here since nothing else needs it; httpx is likewise only imported once
+    # a request is about to be made.
+    try:
+        import uvloop
+    except ImportError:  # Optional; not available on Windows
+        uvloop = None
+    run = uvloop.run if uvloop is not None else asyncio.run
+    try:
+        sys.exit(run(_run()))
+    except KeyboardInterrupt:
+        print("\nCancelled.")
+        sys.exit(130)